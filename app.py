@@ -168,4 +168,7 @@ def wind_data():
     return response
 
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=8080)
\ No newline at end of file
+    # Debug mode (and its reloader) only when explicitly asked for; never in
+    # production, where this runs under gunicorn anyway.
+    debug = os.getenv("FLASK_DEBUG", "0") == "1"
+    app.run(debug=debug, host="0.0.0.0", port=8080)
\ No newline at end of file
@@ -0,0 +1,14 @@
+import multiprocessing
+
+# Run the FastAPI overlay service with:
+#   gunicorn -c gunicorn.conf.py main:app
+# One CPU-heavy overlay request no longer blocks every other request the way
+# it does under a single uvicorn --reload process.
+bind = "0.0.0.0:8000"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app once in the master so module-level state (color palette,
+# warmed JIT kernels, unit-axis cache) is shared copy-on-write by the
+# forked workers instead of rebuilt per process.
+preload_app = True
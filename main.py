@@ -1,24 +1,41 @@
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 import os
 import numpy as np
-from scipy.interpolate import griddata
+from scipy.spatial import cKDTree
+from scipy.ndimage import zoom
 from matplotlib.colors import to_rgba
 from io import BytesIO
-from PIL import Image
+from PIL import Image, ImageDraw
 import base64
-from datetime import datetime
+import hashlib
+import select
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
 import redis
-import json
-import matplotlib.pyplot as plt
-import matplotlib
-from datetime import datetime
-
-# Use 'Agg' backend for headless environments
-matplotlib.use('Agg')
+import orjson
+
+# Numba is optional: when installed the colorization kernel is JIT-compiled
+# and parallelized across cores, otherwise the vectorized NumPy path is used.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# CuPy is optional too: with a CUDA device the per-stripe interpolation and
+# colorization run on the GPU and only the final uint8 pixels come back.
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    CUPY_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
@@ -48,84 +65,331 @@ redis_client = redis.Redis(
     decode_responses=True
 )
 
+# Separate client without response decoding for raw PNG bytes.
+redis_binary = redis.Redis(
+    host=os.getenv("REDIS_HOST", "localhost"),
+    port=int(os.getenv("REDIS_PORT", 6379)),
+    db=0,
+    decode_responses=False
+)
+
+# Postgres connection pool, created on first use so importing the module
+# doesn't require a reachable database. Amortizes the TCP+auth handshake
+# that a fresh psycopg2.connect pays on every request.
+_POOL = None
+
+def get_db_pool():
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadedConnectionPool(
+            2, 20,
+            dbname=os.getenv("DB_NAME", "airqo"),
+            user=os.getenv("DB_USER", "postgres"),
+            password=os.getenv("DB_PASS", "postgres"),
+            host=os.getenv("DB_HOST", "localhost"),
+            port=os.getenv("DB_PORT", "5432")
+        )
+    return _POOL
+
+@app.on_event("shutdown")
+def close_db_pool():
+    if _POOL is not None:
+        _POOL.closeall()
+
+# Cache entries live long and are invalidated by real ingest events (the ETL
+# job runs NOTIFY cams_pm25_updated after inserting), not by a short clock.
+CACHE_TTL_SECONDS = 86400
+
+def _listen_for_updates():
+    while True:
+        try:
+            conn = psycopg2.connect(
+                dbname=os.getenv("DB_NAME", "airqo"),
+                user=os.getenv("DB_USER", "postgres"),
+                password=os.getenv("DB_PASS", "postgres"),
+                host=os.getenv("DB_HOST", "localhost"),
+                port=os.getenv("DB_PORT", "5432")
+            )
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            cur = conn.cursor()
+            cur.execute("LISTEN cams_pm25_updated;")
+            while True:
+                if select.select([conn], [], [], 60) == ([], [], []):
+                    continue
+                conn.poll()
+                if not conn.notifies:
+                    continue
+                conn.notifies.clear()
+                timestamp_key = datetime.today().strftime("%Y-%m-%dT%H")
+                today = datetime.today().date()
+                for key in (f"airqo:aqi_overlay:{timestamp_key}",
+                            f"airqo:aqi_png:{timestamp_key}",
+                            f"airqo:aqi_raw:{today}"):
+                    redis_client.delete(key)
+                print("[Listener] cams_pm25_updated: cache invalidated")
+        except Exception as e:
+            print(f"[Listener Error] {e}")
+            time.sleep(10)
+
+@app.on_event("startup")
+def start_update_listener():
+    threading.Thread(target=_listen_for_updates, daemon=True).start()
+
 # --- Shared Utility Functions ---
 
 def normalize_longitude(lon):
+    # Works on scalars and whole NumPy columns alike.
     return ((lon + 180) % 360) - 180
 
+# Spatial indexes reused across requests: the station set barely changes
+# hour-to-hour, so rebuild the tree only when the coordinates actually do.
+_TREE_CACHE = OrderedDict()
+_TREE_CACHE_MAX = 8
+
+def get_station_tree(points):
+    # Contiguity keeps cKDTree construction (and the hash below) on the
+    # fast path regardless of how the caller sliced the coordinates.
+    points = np.ascontiguousarray(points)
+    key = hashlib.blake2b(points.tobytes(), digest_size=16).digest()
+    tree = _TREE_CACHE.get(key)
+    if tree is None:
+        tree = cKDTree(points)
+        _TREE_CACHE[key] = tree
+        if len(_TREE_CACHE) > _TREE_CACHE_MAX:
+            _TREE_CACHE.popitem(last=False)
+    else:
+        _TREE_CACHE.move_to_end(key)
+    return tree
+
+def idw_interpolate(tree, values, grid_lat, grid_lon, k=8):
+    """Inverse-distance-weighted interpolation onto a grid.
+
+    Queries the k nearest stations for every grid point using all cores,
+    then combines them with 1/d^2 weights. Much faster than griddata's
+    cubic path, which re-triangulates the stations on every call.
+    """
+    targets = np.column_stack([grid_lat.ravel(), grid_lon.ravel()])
+    values = np.ascontiguousarray(values)  # column views have stride > 1
+    k = min(k, len(values))
+    dist, ii = tree.query(targets, k=k, workers=-1)
+    if k == 1:
+        dist = dist[:, None]
+        ii = ii[:, None]
+    weights = 1.0 / (dist ** 2 + 1e-12)
+    interpolated = (values[ii] * weights).sum(axis=1) / weights.sum(axis=1)
+    return interpolated.reshape(grid_lat.shape)
+
+if CUPY_AVAILABLE:
+    def idw_colorize_stripe_gpu(lats_gpu, lons_gpu, aqis_gpu, grid_lat, grid_lon):
+        """GPU version of one stripe: brute-force IDW over all stations plus
+        the palette lookup, returning host-side uint8 RGBA."""
+        glat = cp.asarray(grid_lat.ravel(), dtype=cp.float32)
+        glon = cp.asarray(grid_lon.ravel(), dtype=cp.float32)
+        d2 = (glat[:, None] - lats_gpu[None, :]) ** 2 \
+            + (glon[:, None] - lons_gpu[None, :]) ** 2
+        weights = 1.0 / (d2 + 1e-12)
+        aqi = (weights @ aqis_gpu) / weights.sum(axis=1)
+        idx = cp.digitize(aqi, cp.asarray(_AQI_BINS), right=True)
+        rgba = cp.asarray(_AQI_PALETTE)[idx]
+        return cp.asnumpy(rgba).reshape(grid_lat.shape + (4,))
+
 # --- AQI Functions ---
 
-def aqi_to_color(aqi):
-    if aqi <= 50:
-        return to_rgba("green")
-    elif aqi <= 100:
-        return to_rgba("yellow")
-    elif aqi <= 150:
-        return to_rgba("orange")
-    elif aqi <= 200:
-        return to_rgba("red")
-    elif aqi <= 300:
-        return to_rgba("purple")
-    else:
-        return to_rgba("maroon")
-
-def pm25_to_aqi(pm): 
-    pm = max(0, min(pm, 500))  # Ensure PM2.5 is between 0 and 500
-
-    if pm <= 9:
-        aqi = (50 / 9) * pm
-    elif pm <= 35.4:
-        aqi = ((100 - 51) / (35.4 - 9.1)) * (pm - 9.1) + 51
-    elif pm <= 55.4:
-        aqi = ((150 - 101) / (55.4 - 35.5)) * (pm - 35.5) + 101
-    elif pm <= 150.4:
-        aqi = ((200 - 151) / (150.4 - 55.5)) * (pm - 55.5) + 151
-    elif pm <= 250.4:
-        aqi = ((300 - 201) / (250.4 - 150.5)) * (pm - 150.5) + 201
-    else:
-        aqi = ((500 - 301) / (500.4 - 250.5)) * (pm - 250.5) + 301
+# AQI category breakpoints and their colors, precomputed once at import so the
+# hot path can colorize a whole grid with a single LUT lookup instead of
+# calling to_rgba per pixel.
+_AQI_BINS = np.array([50, 100, 150, 200, 300], dtype=np.float32)
+_AQI_BINS_TUPLE = (50.0, 100.0, 150.0, 200.0, 300.0)  # compile-time constant for Numba
+_AQI_COLORS = ["green", "yellow", "orange", "red", "purple", "maroon"]
+_AQI_PALETTE = (np.array([to_rgba(c) for c in _AQI_COLORS]) * 255).astype(np.uint8)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _colorize_kernel(grid_aqi, palette, thresholds, out):
+        for i in prange(grid_aqi.shape[0]):
+            for j in range(grid_aqi.shape[1]):
+                v = grid_aqi[i, j]
+                if np.isnan(v):
+                    out[i, j, :] = 0
+                else:
+                    k = 0
+                    while k < 5 and v > thresholds[k]:
+                        k += 1
+                    out[i, j, :] = palette[k]
+
+# RGBA output buffers reused across calls (stripes all share one shape, so
+# in practice this is a single allocation per process). Safe to hand out
+# because Image.fromarray copies the pixels when the stripe is pasted.
+_RGBA_BUFS = {}
+
+def _rgba_buffer(shape):
+    buf = _RGBA_BUFS.get(shape)
+    if buf is None:
+        buf = np.empty(shape + (4,), dtype=np.uint8)
+        _RGBA_BUFS[shape] = buf
+    return buf
+
+def colorize_aqi_grid(grid_aqi):
+    """Turn a 2D AQI grid into a uint8 RGBA image array (NaN -> transparent)."""
+    if NUMBA_AVAILABLE:
+        out = _rgba_buffer(grid_aqi.shape)
+        _colorize_kernel(np.ascontiguousarray(grid_aqi, dtype=np.float64),
+                         _AQI_PALETTE, _AQI_BINS, out)
+        return out
+    idx = np.digitize(grid_aqi, _AQI_BINS, right=True)
+    nan_mask = np.isnan(grid_aqi)
+    idx[nan_mask] = 0
+    rgba = np.take(_AQI_PALETTE, idx, axis=0, out=_rgba_buffer(grid_aqi.shape))
+    rgba[nan_mask] = 0
+    return rgba
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _pm_grid_to_rgba_kernel(pm_grid, palette, out):
+        for i in prange(pm_grid.shape[0]):
+            for j in range(pm_grid.shape[1]):
+                p = pm_grid[i, j]
+                if np.isnan(p):
+                    out[i, j, :] = 0
+                    continue
+                if p < 0:
+                    p = 0.0
+                elif p > 500:
+                    p = 500.0
+                if p <= 9:
+                    aqi = (50 / 9) * p
+                elif p <= 35.4:
+                    aqi = ((100 - 51) / (35.4 - 9.1)) * (p - 9.1) + 51
+                elif p <= 55.4:
+                    aqi = ((150 - 101) / (55.4 - 35.5)) * (p - 35.5) + 101
+                elif p <= 150.4:
+                    aqi = ((200 - 151) / (150.4 - 55.5)) * (p - 55.5) + 151
+                elif p <= 250.4:
+                    aqi = ((300 - 201) / (250.4 - 150.5)) * (p - 150.5) + 201
+                else:
+                    aqi = ((500 - 301) / (500.4 - 250.5)) * (p - 250.5) + 301
+                if aqi > 500:
+                    aqi = 500.0
+                k = 0
+                while k < 5 and aqi > _AQI_BINS_TUPLE[k]:
+                    k += 1
+                out[i, j, :] = palette[k]
+
+def pm_grid_to_rgba(pm_grid):
+    """Fused PM2.5-grid -> RGBA conversion, skipping the AQI intermediate
+    array when the Numba kernel is available."""
+    if NUMBA_AVAILABLE:
+        out = _rgba_buffer(pm_grid.shape)
+        _pm_grid_to_rgba_kernel(np.ascontiguousarray(pm_grid, dtype=np.float64),
+                                _AQI_PALETTE, out)
+        return out
+    nan_mask = np.isnan(pm_grid)
+    aqi_grid = pm25_to_aqi_array(np.where(nan_mask, 0, pm_grid)).astype(np.float32)
+    aqi_grid[nan_mask] = np.nan
+    return colorize_aqi_grid(aqi_grid)
+
+if NUMBA_AVAILABLE:
+    # Warm the JITs at import so the first request doesn't pay compile time.
+    colorize_aqi_grid(np.zeros((4, 4)))
+    pm_grid_to_rgba(np.zeros((4, 4)))
 
-    return int(min(aqi, 500))  # Ensure AQI is also capped at 500
+def aqi_to_color(aqi):
+    """Scalar palette lookup; the hot path uses colorize_aqi_grid directly."""
+    return _AQI_PALETTE[int(np.digitize(aqi, _AQI_BINS, right=True))]
+
+def pm25_to_aqi(pm):
+    """Scalar wrapper around pm25_to_aqi_array for single-value callers."""
+    return int(pm25_to_aqi_array(np.asarray([pm], dtype=np.float64))[0])
+
+def pm25_to_aqi_array(pms):
+    """Vectorized pm25_to_aqi: converts a whole ndarray of PM2.5 values in
+    one np.select pass instead of one Python call per station."""
+    pms = np.clip(pms, 0, 500)
+    conds = [pms <= 9, pms <= 35.4, pms <= 55.4, pms <= 150.4, pms <= 250.4]
+    choices = [
+        (50 / 9) * pms,
+        ((100 - 51) / (35.4 - 9.1)) * (pms - 9.1) + 51,
+        ((150 - 101) / (55.4 - 35.5)) * (pms - 35.5) + 101,
+        ((200 - 151) / (150.4 - 55.5)) * (pms - 55.5) + 151,
+        ((300 - 201) / (250.4 - 150.5)) * (pms - 150.5) + 201,
+    ]
+    default = ((500 - 301) / (500.4 - 250.5)) * (pms - 250.5) + 301
+    return np.minimum(np.select(conds, choices, default), 500).astype(np.int32)
 
 
 
 def fetch_aqi_data():
-    conn = psycopg2.connect(
-        dbname=os.getenv("DB_NAME", "airqo"),
-        user=os.getenv("DB_USER", "postgres"),
-        password=os.getenv("DB_PASS", "postgres"),
-        host=os.getenv("DB_HOST", "localhost"),
-        port=os.getenv("DB_PORT", "5432")
-    )
-    cur = conn.cursor()
+    today = datetime.today().date()  # datetime.date object
+    raw_key = f"airqo:aqi_raw:{today}"
 
-    today = datetime.today().date()  # datetime.date object 
+    # Raw station vector is cached separately from the rendered image, so an
+    # image-cache miss can still skip the Postgres round trip.
+    try:
+        cached = redis_client.get(raw_key)
+        if cached:
+            return np.asarray(orjson.loads(cached), dtype=np.float32).reshape(-1, 3)
+    except Exception as redis_err:
+        print(f"[Redis Error - get raw] {redis_err}")
+
+    # Stream the result set with COPY straight into a NumPy array instead of
+    # fetchall(), which materializes one Python tuple per row.
     query = """
-        SELECT latitude, longitude, pm2p5
-        FROM cams_pm25
-        WHERE pm2p5 IS NOT NULL
-        AND time::date = %s;
+        COPY (
+            SELECT latitude, longitude, pm2p5
+            FROM cams_pm25
+            WHERE pm2p5 IS NOT NULL
+            AND time::date = CURRENT_DATE
+        ) TO STDOUT WITH CSV
     """
-    cur.execute(query, (today,))
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    valid_data = []
-    for lat, lon, pm in rows:
-        if -90 <= lat <= 90:
-            norm_lon = normalize_longitude(lon)
-            valid_data.append((lat, norm_lon, pm))
-    return valid_data
-
-def create_interpolated_overlay(data, resolution=5000):
-    if not data:
+    buf = BytesIO()
+    pool = get_db_pool()
+    conn = pool.getconn()
+    try:
+        cur = conn.cursor()
+        cur.copy_expert(query, buf)
+        cur.close()
+    finally:
+        pool.putconn(conn)
+
+    buf.seek(0)
+    arr = np.loadtxt(buf, delimiter=',', dtype=np.float32, ndmin=2)
+    if arr.size == 0:
+        return np.empty((0, 3), dtype=np.float32)
+
+    # Vectorized validation + longitude normalization over whole columns.
+    mask = np.isfinite(arr).all(axis=1) & (arr[:, 0] >= -90) & (arr[:, 0] <= 90)
+    arr = arr[mask]
+    arr[:, 1] = normalize_longitude(arr[:, 1])
+
+    if len(arr):
+        try:
+            redis_client.setex(raw_key, CACHE_TTL_SECONDS, orjson.dumps(arr.tolist()))
+        except Exception as redis_err:
+            print(f"[Redis Error - set raw] {redis_err}")
+
+    return arr
+
+# Rows interpolated/colorized per stripe when building the overlay image.
+STRIPE_ROWS = 256
+
+# The [0, 1] axis for a given resolution never changes between requests;
+# build it once and scale by the current bounds instead of calling linspace
+# per request. float32 is plenty for pixel coordinates.
+_UNIT_AXES = {}
+
+def unit_axis(resolution):
+    axis = _UNIT_AXES.get(resolution)
+    if axis is None:
+        axis = np.linspace(0.0, 1.0, resolution, dtype=np.float32)
+        _UNIT_AXES[resolution] = axis
+    return axis
+
+def create_interpolated_overlay(data, resolution=5000, eval_resolution=1000):
+    if data is None or len(data) == 0:
         return None
 
-    lats = np.array([d[0] for d in data])
-    lons = np.array([d[1] for d in data])
-    pms = np.array([d[2] for d in data])
-    aqis = np.array([pm25_to_aqi(pm) for pm in pms])
+    stations = np.asarray(data, dtype=np.float32)
+    lats, lons, pms = stations[:, 0], stations[:, 1], stations[:, 2]
 
     lat_min, lat_max = lats.min(), lats.max()
     lon_min, lon_max = lons.min(), lons.max()
@@ -133,32 +397,64 @@ def create_interpolated_overlay(data, resolution=5000):
     if lon_max - lon_min > 180:
         lon_min, lon_max = -180, 180
 
-    grid_lon, grid_lat = np.meshgrid(
-        np.linspace(lon_min, lon_max, resolution),
-        np.linspace(lat_max, lat_min, resolution)
-    )
-
-    grid_aqi = griddata((lats, lons), aqis, (grid_lat, grid_lon), method='cubic')
-
-    rgba_image = np.zeros((resolution, resolution, 4))
-    for i in range(resolution):
-        for j in range(resolution):
-            if np.isnan(grid_aqi[i, j]):
-                rgba_image[i, j] = (0, 0, 0, 0)
-            else:
-                rgba_image[i, j] = aqi_to_color(grid_aqi[i, j])
-
-    img = Image.fromarray((rgba_image * 255).astype(np.uint8), mode="RGBA")
+    tree = get_station_tree(np.column_stack([lats, lons]))
+
+    if CUPY_AVAILABLE:
+        # The GPU stripe kernel interpolates station-level AQI values.
+        lats_gpu = cp.asarray(lats, dtype=cp.float32)
+        lons_gpu = cp.asarray(lons, dtype=cp.float32)
+        aqis_gpu = cp.asarray(pm25_to_aqi_array(pms), dtype=cp.float32)
+
+    # Interpolate and colorize in horizontal stripes instead of one
+    # resolution^2 pass: peak memory stays O(resolution * STRIPE_ROWS)
+    # rather than holding the full float grid plus RGBA buffer at once.
+    axis = unit_axis(resolution)
+    grid_lon_1d = lon_min + axis * (lon_max - lon_min)
+    grid_lat_1d = lat_max - axis * (lat_max - lat_min)
+
+    # The interpolated field is smooth, so evaluating the IDW at a coarser
+    # eval_resolution and bilinearly upsampling is visually equivalent while
+    # doing (resolution/eval_resolution)^2 fewer tree queries.
+    pm_full = None
+    if not CUPY_AVAILABLE and eval_resolution and eval_resolution < resolution:
+        eval_axis = unit_axis(eval_resolution)
+        eval_lon = lon_min + eval_axis * (lon_max - lon_min)
+        eval_lat = lat_max - eval_axis * (lat_max - lat_min)
+        grid_lon, grid_lat = np.meshgrid(eval_lon, eval_lat, copy=False)
+        pm_coarse = idw_interpolate(tree, pms, grid_lat, grid_lon)
+        pm_full = zoom(pm_coarse, resolution / eval_resolution,
+                       order=1).astype(np.float32)
+
+    img = Image.new("RGBA", (resolution, resolution))
+    for row_start in range(0, resolution, STRIPE_ROWS):
+        lat_stripe = grid_lat_1d[row_start:row_start + STRIPE_ROWS]
+        if CUPY_AVAILABLE:
+            grid_lon, grid_lat = np.meshgrid(grid_lon_1d, lat_stripe, copy=False)
+            stripe_rgba = idw_colorize_stripe_gpu(
+                lats_gpu, lons_gpu, aqis_gpu, grid_lat, grid_lon)
+        elif pm_full is not None:
+            stripe_rgba = pm_grid_to_rgba(
+                pm_full[row_start:row_start + STRIPE_ROWS])
+        else:
+            # Interpolate the raw PM2.5 field and convert straight to pixels;
+            # AQI only ever exists per-stripe, never as a full-size grid.
+            grid_lon, grid_lat = np.meshgrid(grid_lon_1d, lat_stripe, copy=False)
+            pm_grid = idw_interpolate(tree, pms, grid_lat, grid_lon)
+            stripe_rgba = pm_grid_to_rgba(pm_grid)
+        img.paste(Image.fromarray(stripe_rgba, mode="RGBA"), (0, row_start))
 
     buf = BytesIO()
-    img.save(buf, format='PNG')
-    img_b64 = base64.b64encode(buf.getvalue()).decode('utf-8')
-    data_url = f"data:image/png;base64,{img_b64}"
-
-    return {
+    # zlib level 1: ~3-4x faster encode than the default level 6, slightly
+    # larger PNG — fine for a transient overlay that is re-cached server-side.
+    img.save(buf, format='PNG', compress_level=1, optimize=False)
+
+    # Return the raw PNG bytes and a small metadata dict instead of a base64
+    # data URL: inlining the image in JSON copied the ~100 MB string through
+    # base64, json.dumps, Redis and json.loads on every hit.
+    meta = {
         "mapimage": {
-            "image": data_url,
-            "bounds": [[lat_min, lon_min], [lat_max, lon_max]],
+            "bounds": [[float(lat_min), float(lon_min)],
+                       [float(lat_max), float(lon_max)]],
             "lat_min": float(lat_min),
             "lat_max": float(lat_max),
             "lon_min": float(lon_min),
@@ -168,14 +464,16 @@ def create_interpolated_overlay(data, resolution=5000):
             "generated_at": datetime.now().isoformat() + "Z"
         }
     }
- 
+    return buf.getvalue(), meta
+
+def create_wind_overlay(data, resolution=40):
     if not data:
         return None
 
-    lats = np.array([d[0] for d in data])
-    lons = np.array([d[1] for d in data])
-    us = np.array([d[2] for d in data])
-    vs = np.array([d[3] for d in data])
+    # One pass over the rows (slicing off any trailing timestamp column)
+    # instead of four separate list comprehensions.
+    stations = np.asarray([row[:4] for row in data], dtype=np.float64)
+    lats, lons, us, vs = stations.T
 
     lat_min, lat_max = lats.min(), lats.max()
     lon_min, lon_max = lons.min(), lons.max()
@@ -185,20 +483,33 @@ def create_interpolated_overlay(data, resolution=5000):
         np.linspace(lat_min, lat_max, resolution)
     )
 
-    grid_u = griddata((lats, lons), us, (grid_lat, grid_lon), method='linear')
-    grid_v = griddata((lats, lons), vs, (grid_lat, grid_lon), method='linear')
+    tree = get_station_tree(np.column_stack([lats, lons]))
+    grid_u = idw_interpolate(tree, us, grid_lat, grid_lon)
+    grid_v = idw_interpolate(tree, vs, grid_lat, grid_lon)
+
+    # Draw the arrows directly with PIL instead of spinning up a matplotlib
+    # figure + quiver + savefig per request; for ~1600 arrows this is
+    # milliseconds instead of half a second.
+    width = height = 600
+    scale = 4.0
+    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
 
-    fig, ax = plt.subplots(figsize=(6, 6), dpi=100)
-    ax.set_xlim(lon_min, lon_max)
-    ax.set_ylim(lat_min, lat_max)
-    ax.set_axis_off()
+    px = np.linspace(0, width - 1, resolution)
+    py = np.linspace(height - 1, 0, resolution)  # row i holds ascending lats
+    dx = grid_u * scale
+    dy = -grid_v * scale  # image y grows downward
 
-    q = ax.quiver(grid_lon, grid_lat, grid_u, grid_v, color='blue', scale=5)
+    for i in range(resolution):
+        for j in range(resolution):
+            draw.line(
+                (px[j], py[i], px[j] + dx[i, j], py[i] + dy[i, j]),
+                fill=(0, 0, 255, 255)
+            )
 
     buf = BytesIO()
-    plt.savefig(buf, format="png", transparent=True, bbox_inches='tight', pad_inches=0)
+    img.save(buf, format='PNG', compress_level=1, optimize=False)
     buf.seek(0)
-    plt.close(fig)
 
     img_b64 = base64.b64encode(buf.getvalue()).decode("utf-8")
     data_url = f"data:image/png;base64,{img_b64}"
@@ -219,6 +530,30 @@ def create_interpolated_overlay(data, resolution=5000):
 
 # --- API Endpoints ---
 
+def build_and_cache_overlay(timestamp_key, cache_key, ttl):
+    """Generate the overlay and cache PNG bytes + metadata under separate keys.
+
+    Returns (meta, error_message); exactly one of the two is None.
+    """
+    data = fetch_aqi_data()
+    if len(data) == 0:
+        return None, "No valid data available"
+
+    overlay = create_interpolated_overlay(data)
+    if overlay is None:
+        return None, "Could not generate overlay"
+
+    png_bytes, meta = overlay
+    meta["mapimage"]["image_url"] = f"/aqi-image/{timestamp_key}"
+
+    try:
+        redis_binary.setex(f"airqo:aqi_png:{timestamp_key}", ttl, png_bytes)
+        redis_client.setex(cache_key, ttl, orjson.dumps(meta))
+    except Exception as redis_err:
+        print(f"[Redis Error - set] {redis_err}")
+
+    return meta, None
+
 @app.get("/aqi-data")
 async def get_aqi_data():
     try:
@@ -229,27 +564,63 @@ async def get_aqi_data():
         try:
             cached = redis_client.get(cache_key)
             if cached:
-                return JSONResponse(content=json.loads(cached))
+                return JSONResponse(content=orjson.loads(cached))
         except Exception as redis_err:
             print(f"[Redis Error - get] {redis_err}")
 
-        # Generate new data
-        data = fetch_aqi_data()
-        if not data:
-            return JSONResponse(status_code=404, content={"message": "No valid data available"})
-
-        result = create_interpolated_overlay(data)
-        if not result:
-            return JSONResponse(status_code=404, content={"message": "Could not generate overlay"})
-
-        # Cache for 10 minutes
+        # Only one worker regenerates on a miss; the rest poll for its result
+        # or fall back to the previous hour instead of piling onto the CPU.
+        lock_key = f"lock:{cache_key}"
         try:
-            redis_client.setex(cache_key, 120, json.dumps(result))
+            got_lock = bool(redis_client.set(lock_key, "1", nx=True, ex=60))
         except Exception as redis_err:
-            print(f"[Redis Error - set] {redis_err}")
+            print(f"[Redis Error - lock] {redis_err}")
+            got_lock = True  # Redis down: just build, there is nothing to wait on
+
+        if not got_lock:
+            for _ in range(25):
+                time.sleep(0.2)
+                try:
+                    cached = redis_client.get(cache_key)
+                except Exception:
+                    break
+                if cached:
+                    return JSONResponse(content=orjson.loads(cached))
+
+            prev_hour = (datetime.today() - timedelta(hours=1)).strftime("%Y-%m-%dT%H")
+            try:
+                cached = redis_client.get(f"airqo:aqi_overlay:{prev_hour}")
+                if cached:
+                    return JSONResponse(content=orjson.loads(cached))
+            except Exception as redis_err:
+                print(f"[Redis Error - get] {redis_err}")
+            # No cached fallback either; build it ourselves.
 
-        return result
+        try:
+            meta, error = build_and_cache_overlay(timestamp_key, cache_key, CACHE_TTL_SECONDS)
+        finally:
+            if got_lock:
+                try:
+                    redis_client.delete(lock_key)
+                except Exception as redis_err:
+                    print(f"[Redis Error - unlock] {redis_err}")
 
+        if error:
+            return JSONResponse(status_code=404, content={"message": error})
+
+        return meta
+
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"message": str(e)})
+
+# serves the raw PNG bytes cached next to the overlay metadata
+@app.get("/aqi-image/{timestamp_key}")
+async def get_aqi_image(timestamp_key: str):
+    try:
+        png_bytes = redis_binary.get(f"airqo:aqi_png:{timestamp_key}")
+        if png_bytes is None:
+            return JSONResponse(status_code=404, content={"message": "Image not found"})
+        return Response(content=png_bytes, media_type="image/png")
     except Exception as e:
         return JSONResponse(status_code=500, content={"message": str(e)})
 
@@ -260,6 +631,7 @@ async def invalidate_aqi_cache():
         timestamp_key = datetime.today().strftime("%Y-%m-%dT%H")
         cache_key = f"airqo:aqi_overlay:{timestamp_key}"
         redis_client.delete(cache_key)
+        redis_client.delete(f"airqo:aqi_png:{timestamp_key}")
         return {"message": f"Cache {cache_key} invalidated successfully."}
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -272,16 +644,11 @@ async def refresh_aqi_cache():
         cache_key = f"airqo:aqi_overlay:{timestamp_key}"
 
         redis_client.delete(cache_key)
+        redis_client.delete(f"airqo:aqi_png:{timestamp_key}")
 
-        data = fetch_aqi_data()
-        if not data:
-            return JSONResponse(status_code=404, content={"message": "No valid data available"})
-
-        result = create_interpolated_overlay(data)
-        if not result:
-            return JSONResponse(status_code=404, content={"message": "Could not generate overlay"})
-
-        redis_client.setex(cache_key, 3600, json.dumps(result))
+        meta, error = build_and_cache_overlay(timestamp_key, cache_key, CACHE_TTL_SECONDS)
+        if error:
+            return JSONResponse(status_code=404, content={"message": error})
 
         return {"message": "Cache refreshed successfully", "key": cache_key}
     except Exception as e: